@@ -1,6 +1,310 @@
+import atexit
+import json
+import logging
+import numbers
+import os
 import serial
 import serial.tools.list_ports
+import struct
+import subprocess
+import sys
+import threading
 import time
+from contextlib import contextmanager
+
+_log = logging.getLogger(__name__)
+
+_IOSSDATALAT = 0x80085400  # _IOW('T', 0, unsigned long) from IOKit/serial/ioss.h
+
+# USB (vid, pid) pairs of common DMX/serial adapter chips
+_KNOWN_USB_IDS = {
+    (0x0403, 0x6001),  # FTDI FT232R (OpenDMX, Enttec DMX USB Pro)
+    (0x0403, 0x6010),  # FTDI FT2232
+    (0x0403, 0x6014),  # FTDI FT232H
+    (0x0403, 0x6015),  # FTDI FT230X / FT231X
+    (0x1A86, 0x7523),  # WCH CH340
+    (0x067B, 0x2303),  # Prolific PL2303
+}
+
+_PORT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".party", "dmx_port.json")
+_SERIAL_BY_ID_DIR = "/dev/serial/by-id"
+
+
+def _read_port_cache():
+    """
+    Returns the device path of the last auto-detected port if it still exists, otherwise None.
+    """
+    try:
+        with open(_PORT_CACHE_PATH) as f:
+            device = json.load(f).get("device")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return device if device and os.path.exists(device) else None
+
+
+def _stable_device_path(device):
+    """
+    Returns a path for device that keeps naming the same adapter across replugs, or None.
+
+    On Linux, /dev/ttyUSB* numbers are handed out in plug order, so the udev alias under
+    /dev/serial/by-id (which encodes vendor, product and serial number) is used instead.
+    Other platforms already name ports after the adapter (e.g. /dev/cu.usbserial-A1B2C3).
+    """
+    if not sys.platform.startswith("linux"):
+        return device
+    try:
+        names = os.listdir(_SERIAL_BY_ID_DIR)
+    except OSError:
+        return None
+    real = os.path.realpath(device)
+    for name in names:
+        path = os.path.join(_SERIAL_BY_ID_DIR, name)
+        if os.path.realpath(path) == real:
+            return path
+    return None
+
+
+def _write_port_cache(device):
+    """
+    Records an auto-detected port that opened successfully, so later connects can skip
+    the USB scan. Ports without a stable path are not cached. Best effort.
+    """
+    device = _stable_device_path(device)
+    if device is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(_PORT_CACHE_PATH), exist_ok=True)
+        with open(_PORT_CACHE_PATH, "w") as f:
+            json.dump({"device": device}, f)
+    except OSError:
+        pass
+
+
+def _clear_port_cache():
+    """
+    Forgets the cached port, e.g. after it failed to open.
+    """
+    try:
+        os.remove(_PORT_CACHE_PATH)
+    except OSError:
+        pass
+
+
+# port -> [serial.Serial, number of controllers using it, channel state, packet, write lock]
+_shared_ports = {}
+_shared_ports_lock = threading.Lock()
+
+
+def _acquire_serial(port, baudrate, timeout, write_timeout, num_channels):
+    """
+    Returns an open serial.Serial for port, reusing the one another controller already
+    opened if there is one. Controllers on the same port also share its channel state,
+    packet buffer and write lock, so they update one universe instead of overwriting
+    each other's channels. Each call must be paired with _release_serial(port, ser).
+
+    Returns:
+        tuple: (list, bool) with the port's entry [serial.Serial, users, state, packet, lock]
+               and True if the port was newly opened.
+
+    Raises:
+        serial.SerialException: If the port is already open with a different num_channels.
+    """
+    with _shared_ports_lock:
+        entry = _shared_ports.get(port)
+        if entry and entry[0].is_open:
+            if len(entry[2]) != num_channels:
+                raise serial.SerialException(
+                    f"{port} is already open with {len(entry[2])} channels."
+                )
+            entry[1] += 1
+            return entry, False
+
+        ser = serial.Serial(
+            port=port,
+            baudrate=baudrate,
+            timeout=timeout,
+            write_timeout=write_timeout,
+            inter_byte_timeout=None,
+            rtscts=False,
+            dsrdtr=False,
+        )
+        entry = [
+            ser,
+            1,
+            bytearray(num_channels),
+            bytearray(num_channels + 1),
+            threading.Lock(),
+        ]
+        _shared_ports[port] = entry
+        return entry, True
+
+
+def _release_serial(port, ser):
+    """
+    Drops one reference to a port from _acquire_serial(); the last one closes it.
+    A handle that has since been replaced in the pool (e.g. after it was closed and
+    the port reopened) is ignored, so it cannot release the new one.
+    """
+    with _shared_ports_lock:
+        entry = _shared_ports.get(port)
+        if entry is None or entry[0] is not ser:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _shared_ports[port]
+            entry[0].close()
+
+
+_LAMP_MODES = {
+    "off": 0,
+    "manual": (1, 99),  # Range for manual mode
+    "dynamic_sound": (100, 199),  # Range for dynamic sound control
+    "tune_program": (200, 219),  # Range for tuning program library
+    "sound_program": (220, 249),  # Range for sound-control program library
+    "off_end": (250, 255),  # Off at the end of the range
+}
+_LAMP_MODES_STR = ", ".join(_LAMP_MODES)
+
+_PATTERN_SIZE_MODES = {
+    "parts_blank": (0, 49),
+    "returns": (50, 99),
+    "folds": (100, 149),
+    "crossing": (150, 199),
+    "blanking": (200, 255),
+}
+_PATTERN_SIZE_MODES_STR = ", ".join(_PATTERN_SIZE_MODES)
+
+_PATTERN_ZOOMING_MODES = {
+    "static": (0, 127),
+    "zoom_in": (128, 159),
+    "zoom_out": (160, 191),
+    "flip_zooming": (192, 255),
+}
+_PATTERN_ZOOMING_MODES_STR = ", ".join(_PATTERN_ZOOMING_MODES)
+
+_PATTERN_ROTATION_MODES = {
+    "static": (0, 127),
+    "dynamic_inversion": (
+        128,
+        255,
+    ),  # This mode has two ranges in the CSV, assuming they both use same function
+}
+_PATTERN_ROTATION_MODES_STR = ", ".join(_PATTERN_ROTATION_MODES)
+
+_HORIZONTAL_MOVEMENT_MODES = {
+    "static": (0, 127),
+    "push_up": (128, 159),
+    "push_down": (160, 191),
+    "left_shift": (192, 223),
+    "right_shift": (224, 255),
+}
+_HORIZONTAL_MOVEMENT_MODES_STR = ", ".join(_HORIZONTAL_MOVEMENT_MODES)
+
+_VERTICAL_MOVEMENT_MODES = {
+    "static": (0, 127),
+    "right_push": (128, 159),
+    "left_push": (160, 191),
+    "move_up": (192, 223),
+    "move_down": (224, 255),
+}
+_VERTICAL_MOVEMENT_MODES_STR = ", ".join(_VERTICAL_MOVEMENT_MODES)
+
+_HORIZONTAL_ZOOMING_MODES = {
+    "static": (0, 127),
+    "push_up_distortion": (128, 159),
+    "push_down_distortion": (160, 191),
+    "zooming": (192, 223),
+    "flip_zooming": (224, 255),
+}
+_HORIZONTAL_ZOOMING_MODES_STR = ", ".join(_HORIZONTAL_ZOOMING_MODES)
+
+_VERTICAL_ZOOMING_MODES = {
+    "static": (0, 127),
+    "right_push_distortion": (128, 159),
+    "left_push_distortion": (160, 191),
+    "zoom": (192, 223),
+    "dynamic_flip_zooming": (224, 255),
+}
+_VERTICAL_ZOOMING_MODES_STR = ", ".join(_VERTICAL_ZOOMING_MODES)
+
+_STROBE_FLASH_MODES = {
+    "off": (0, 15),
+    "strobe": (16, 131),
+    "random_flash": (132, 147),
+    "sound_strobe": (148, 199),
+    "sound_random_flash": (200, 215),
+    "on": (216, 255),
+}
+_STROBE_FLASH_MODES_STR = ", ".join(_STROBE_FLASH_MODES)
+
+_NODE_HIGHLIGHTING_MODES = {
+    "brighter": (0, 63),
+    "broken_lines": (64, 127),
+    "scanning_line": (
+        128,
+        223,
+    ),  # The CSV lists 128-159, but with 224-255 reserved, it is likely a typo.
+}
+_NODE_HIGHLIGHTING_MODES_STR = ", ".join(_NODE_HIGHLIGHTING_MODES)
+
+_GRADUAL_DRAWING_MODES = {
+    "forward_manual": (0, 63),
+    "reverse_manual": (64, 127),
+    "dynamic_A": (128, 159),
+    "dynamic_B": (160, 191),
+    "dynamic_C": (192, 223),
+    "dynamic_D": (224, 255),
+}
+_GRADUAL_DRAWING_MODES_STR = ", ".join(_GRADUAL_DRAWING_MODES)
+
+_HORIZONTAL_FLIP_MODES = {
+    "static": (0, 127),
+    "push_up_distortion": (128, 159),
+    "push_down_distortion": (160, 191),
+    "flip": (192, 223),
+}
+_HORIZONTAL_FLIP_MODES_STR = ", ".join(_HORIZONTAL_FLIP_MODES)
+
+_VERTICAL_FLIP_MODES = {
+    "static": (0, 127),
+    "right_push_distortion": (128, 159),
+    "left_push_distortion": (160, 191),
+    "flip": (192, 255),
+}
+_VERTICAL_FLIP_MODES_STR = ", ".join(_VERTICAL_FLIP_MODES)
+
+# mode -> (min, max, fixed value or None if the caller supplies one)
+_FORCED_COLOR_MODES = {
+    "primary": (0, 0, 0),
+    "change_every_n": (1, 255, None),  # value is N
+}
+
+_GALLERY_VALUES = {
+    0: 0,  # Beam gallery
+    1: 240,  # Animation gallery
+}
+
+_PATTERN_LIBRARY_MODES = {
+    "default": 0,  # using the beam library by default and has no function
+}
+
+_COLOR_CHANGE_MODES = {
+    "primary": (0, 7),
+    "white": (8, 15),
+    "red": (16, 23),
+    "yellow": (24, 31),
+    "green": (32, 39),
+    "indigo": (40, 47),
+    "blue": (48, 55),
+    "purple": (56, 63),
+    "rgb_cycle": (64, 95),
+    "yip_cycle": (96, 127),
+    "full_color_cycle": (128, 159),
+    "colorful_change": (160, 191),
+    "forward_movement": (192, 223),
+    "reverse_movement": (224, 255),
+}
+_COLOR_CHANGE_MODES_STR = ", ".join(_COLOR_CHANGE_MODES)
 
 
 class DmxController:
@@ -8,7 +312,42 @@ class DmxController:
     Low-level API for controlling a DMX512 laser projector via USB on macOS.
     """
 
-    def __init__(self, port=None, baudrate=250000, num_channels=32, timeout=1):
+    # 0-based indices into current_state; pairs are (laser 1, laser 2)
+    _CH_LAMP = 0
+    _CH_PATTERN_SIZE = (1, 18)
+    _CH_GALLERY = 2
+    _CH_PATTERN = (3, 20)
+    _CH_PATTERN_ZOOMING = (4, 21)
+    _CH_PATTERN_ROTATION = (5, 22)
+    _CH_HORIZONTAL_MOVEMENT = (6, 23)
+    _CH_VERTICAL_MOVEMENT = (7, 24)
+    _CH_HORIZONTAL_ZOOMING = 8
+    _CH_VERTICAL_ZOOMING = 9
+    _CH_FORCED_COLOR = (10, 27)
+    _CH_STROBE_FLASH = 11
+    _CH_NODE_HIGHLIGHTING = (12, 29)
+    _CH_NODE_EXPANSION = (13, 30)
+    _CH_GRADUAL_DRAWING = (14, 31)
+    _CH_DISTORTION_DEGREE = (15, 16)
+    _CH_SECOND_LAMP_PATTERN = 17
+    _CH_PATTERN_LIBRARY = 19
+    _CH_HORIZONTAL_FLIP = 25
+    _CH_VERTICAL_FLIP = 26
+    _CH_COLOR_CHANGE = 28
+
+    def __init__(
+        self,
+        port=None,
+        baudrate=250000,
+        num_channels=32,
+        timeout=1,
+        write_timeout=0.1,
+        threaded=False,
+        backend="pyserial",
+        use_process=False,
+        refresh_rate=None,
+        offline=False,
+    ):
         """
         Initializes the DmxController.
 
@@ -18,39 +357,113 @@ class DmxController:
             baudrate (int, optional): The baud rate for serial communication. Defaults to 250000.
             num_channels (int, optional): The number of DMX channels. Defaults to 32.
             timeout (float, optional): Timeout for serial communication in seconds. Defaults to 1.
+            write_timeout (float, optional): Maximum time a frame write may block, in seconds.
+                                             Defaults to 0.1.
+            threaded (bool, optional): If True, frames are written by a background thread so
+                                       setters never block on USB; bursts of updates collapse
+                                       into a single write of the latest state. Defaults to False.
+            backend (str, optional): 'pyserial' to go through the OS serial driver, or 'pyftdi'
+                                     to talk to an FTDI adapter directly over libusb (requires
+                                     the optional pyftdi package; port is then an ftdi:// URL,
+                                     defaulting to the first FTDI device). Defaults to 'pyserial'.
+            use_process (bool, optional): If True, a child process owns the serial port and
+                                          frames are handed to it through a queue, so writes
+                                          never block this process. Defaults to False.
+            refresh_rate (float, optional): If set, a background thread also re-sends the last
+                                            frame this many times per second, as DMX512
+                                            fixtures expect a continuous signal (44 is the
+                                            protocol's full-universe rate). Implies threaded.
+                                            Like every frame this controller writes, refreshes
+                                            carry no host-generated BREAK, so only enable this
+                                            for interfaces that frame DMX themselves (e.g.
+                                            DMX USB Pro style or microcontroller adapters),
+                                            not raw FTDI cables. Defaults to None.
+            offline (bool, optional): If True, no port is detected or opened and nothing is
+                                      ever sent; the setters only update current_state, e.g.
+                                      to precompute frames. Defaults to False.
         """
 
         self.baudrate = baudrate
         self.num_channels = num_channels
         self.timeout = timeout
+        self.write_timeout = write_timeout
+        self.threaded = threaded
+        self.backend = backend
+        self.use_process = use_process
+        self.refresh_rate = refresh_rate
+        self.offline = offline
         self.port = port
         self.serial_port = None
-        self.current_state = [0] * self.num_channels  # Initialize all channels to 0
+        # Initialize all channels to 0; the packet holds the start code (0) + channel data
+        self._use_buffers(
+            bytearray(self.num_channels),
+            bytearray(self.num_channels + 1),
+            threading.Lock(),
+        )
+        # True while _packet holds the last frame successfully written
+        self._synced = False
+        self._batch_depth = 0
+        self._batch_dirty = False
+        # While a batch is open on a shared port: (shared state, its contents at the start)
+        self._batch_staged_from = None
+        self._tx_event = threading.Event()
+        self._tx_thread = None
+        self._tx_force = False
+        self._tx_stop = False
+        self._fd = None  # Raw descriptor of a pyserial port, for the refresh fast path
+        self._port_from_cache = False
+        self._port_detected = False  # Matched by VID:PID; cached once it opens
+        self._shared_port = False
+
+        if offline:
+            return
 
         if self.port is None:
-            self.port = self._find_usb_serial_port()
-            self.serial_port = serial.Serial(port=port, baudrate=self.baudrate)
+            if self.backend == "pyftdi":
+                self.port = "ftdi:///1"
+            else:
+                self.port = self._find_usb_serial_port()
 
         if self.port:
             self._connect()
+        if self.serial_port and self._port_detected:
+            _write_port_cache(self.port)
+        if self.serial_port:
+            # Close the port (and stop the writer thread) even if the caller never does
+            atexit.register(self.disconnect)
 
     def _find_usb_serial_port(self):
         """
         Attempts to automatically find the USB serial port for the DMX device.
 
+        The last detected port is cached in ~/.party/dmx_port.json (by a stable path,
+        once it has opened) and reused while it exists. Otherwise ports are matched by
+        known adapter USB VID:PID first, then by description.
+
         Returns:
             str: The port name if found, otherwise None.
         """
+        device = _read_port_cache()
+        if device:
+            self._port_from_cache = True
+            _log.info("Using cached DMX device at: %s", device)
+            return device
+
         ports = serial.tools.list_ports.comports()
+        for port in ports:
+            if (port.vid, port.pid) in _KNOWN_USB_IDS:
+                _log.info("Found DMX adapter at: %s", port.device)
+                self._port_detected = True
+                return port.device
         for port in ports:
             # You might need to adjust the criteria based on your device's description
             if (
                 "USB" in port.description.upper()
                 or "SERIAL" in port.description.upper()
             ):
-                print(f"Found potential DMX device at: {port.device}")
+                _log.info("Found potential DMX device at: %s", port.device)
                 return port.device
-        print("Warning: Could not automatically find DMX device port.")
+        _log.warning("Could not automatically find DMX device port.")
         return None
 
     def _connect(self):
@@ -58,37 +471,327 @@ class DmxController:
         Establishes a serial connection to the DMX device.
         """
         try:
-            self.serial_port = serial.Serial(
-                port=self.port, baudrate=self.baudrate, timeout=self.timeout
-            )
-            print(f"Connected to DMX device at {self.port}")
-            time.sleep(2)  # Allow time for the device to initialize after connection
-        except serial.SerialException as e:
-            print(f"Error connecting to DMX device: {e}")
+            if self.use_process:
+                self._connect_process()
+                # The worker already keeps writes off this process; only refreshing needs a thread
+                if self.refresh_rate:
+                    self._start_tx_thread()
+                return
+
+            if self.backend == "pyftdi":
+                self.serial_port = self._open_pyftdi()
+                if self.serial_port is None:
+                    return
+                opened = True
+            else:
+                try:
+                    shared, opened = _acquire_serial(
+                        self.port,
+                        self.baudrate,
+                        self.timeout,
+                        self.write_timeout,
+                        self.num_channels,
+                    )
+                except serial.SerialException:
+                    entry = _shared_ports.get(self.port)
+                    # Not when another controller holds it open (num_channels mismatch)
+                    if self._port_from_cache and not (entry and entry[0].is_open):
+                        _clear_port_cache()
+                    raise
+                self.serial_port = shared[0]
+                self._shared_port = True
+                self._use_buffers(*shared[2:])
+                if os.name == "posix":
+                    self._fd = self.serial_port.fileno()
+
+            if opened:
+                self.serial_port.reset_output_buffer()
+                self._set_low_latency()
+                _log.info("Connected to DMX device at %s", self.port)
+                self._wait_until_ready()
+            else:
+                _log.info("Reusing open connection to DMX device at %s", self.port)
+
+            if self.threaded or self.refresh_rate:
+                self._start_tx_thread()
+        except (serial.SerialException, OSError) as e:
+            _log.error("Error connecting to DMX device: %s", e)
+            if self._shared_port:
+                _release_serial(self.port, self.serial_port)
+                self._detach_buffers()
+                self._shared_port = False
             self.serial_port = None
+            self._fd = None
+
+    def _connect_process(self):
+        """
+        Hands the serial port to a worker process (see controller_worker.py) and sends
+        the initial blank frame through it.
+        """
+        from .controller_worker import SerialProcess
+
+        try:
+            self.serial_port = SerialProcess(
+                self.port, baudrate=self.baudrate, write_timeout=self.write_timeout
+            )
+        except serial.SerialException:
+            if self._port_from_cache:
+                _clear_port_cache()
+            raise
+        _log.info("Connected to DMX device at %s (worker process)", self.port)
+        with self._tx_lock:
+            self._write_frame(force=True)
+
+    def _open_pyftdi(self):
+        """
+        Opens the FTDI adapter through pyftdi's libusb driver, bypassing the OS tty layer.
+
+        Returns:
+            serial.Serial: A pyserial-compatible port, or None if pyftdi is not installed.
+        """
+        try:
+            from pyftdi.serialext import serial_for_url
+        except ImportError:
+            _log.error(
+                "The pyftdi backend requires the pyftdi package (pip install pyftdi)."
+            )
+            return None
+
+        return serial_for_url(
+            self.port,
+            baudrate=self.baudrate,
+            timeout=self.timeout,
+            write_timeout=self.write_timeout,
+        )
+
+    def _wait_until_ready(self, attempts=20, interval=0.01):
+        """
+        Probes a freshly opened port instead of sleeping for a fixed time. Sends the
+        current (blank) frame, then polls until the DSR/CTS handshake goes high or a
+        status byte arrives, for at most attempts * interval seconds. FT232-based
+        adapters are typically ready within 50 ms.
+
+        Args:
+            attempts (int, optional): Maximum number of polls. Defaults to 20.
+            interval (float, optional): Delay between polls in seconds. Defaults to 0.01.
+        """
+        self.serial_port.dtr = True
+        with self._tx_lock:
+            self._write_frame(force=True)
+        for _ in range(attempts):
+            if (
+                self.serial_port.dsr
+                or self.serial_port.cts
+                or self.serial_port.in_waiting
+            ):
+                break
+            time.sleep(interval)
+        self.serial_port.reset_input_buffer()
+
+    def _set_low_latency(self):
+        """
+        Lowers the USB-serial adapter latency (FTDI defaults to 16 ms) so each frame
+        leaves the host immediately. Best effort: failures (e.g., missing permissions
+        or a non-FTDI adapter) are ignored.
+        """
+        if self.backend == "pyftdi":
+            try:
+                self.serial_port.udev.set_latency_timer(1)
+            except (AttributeError, OSError):
+                pass
+        elif sys.platform.startswith("linux"):
+            name = os.path.basename(os.path.realpath(self.port))
+            try:
+                with open(
+                    f"/sys/bus/usb-serial/devices/{name}/latency_timer", "w"
+                ) as f:
+                    f.write("1")
+                return
+            except OSError:
+                pass
+            try:
+                subprocess.run(
+                    ["setserial", self.port, "low_latency"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=2,
+                )
+            except (OSError, subprocess.SubprocessError):
+                pass
+        elif sys.platform == "darwin":
+            import fcntl
+
+            try:
+                fcntl.ioctl(
+                    self.serial_port.fileno(), _IOSSDATALAT, struct.pack("L", 1)
+                )
+            except OSError:
+                pass
 
     def disconnect(self):
         """
-        Closes the serial connection.
+        Closes the serial connection. Safe to call more than once; later calls do nothing,
+        and errors while closing are logged rather than raised.
         """
-        if self.serial_port:
-            self.serial_port.close()
-            print("Disconnected from DMX device.")
+        if self._tx_thread:
+            self._tx_stop = True
+            self._tx_event.set()
+            self._tx_thread.join(timeout=1)
+            self._tx_thread = None
+
+        if self.serial_port is None:
+            _log.debug("Not connected to a DMX device.")
+            return
+
+        atexit.unregister(self.disconnect)
+        with self._tx_lock:
+            try:
+                if self._shared_port:
+                    _release_serial(self.port, self.serial_port)
+                elif self.serial_port.is_open:
+                    self.serial_port.close()
+            except (serial.SerialException, OSError) as e:
+                _log.error("Error closing DMX device: %s", e)
             self.serial_port = None
-        else:
-            print("Not connected to a DMX device.")
+            self._fd = None
+            self._synced = False
+        if self._shared_port:
+            self._detach_buffers()
+            self._shared_port = False
+        _log.info("Disconnected from DMX device.")
+
+    def _use_buffers(self, state, packet, lock):
+        """
+        Points the controller at a channel state, packet buffer and write lock, which
+        are shared with other controllers on the same port (see _acquire_serial).
+
+        Args:
+            state (bytearray): The channel values, num_channels bytes.
+            packet (bytearray): The outgoing frame, num_channels + 1 bytes.
+            lock (threading.Lock): Guards changes to the packet and writes of it to the port.
+        """
+        self.current_state = state
+        self._packet = packet
+        self._state_view = memoryview(packet)[1:]
+        self._state_mv = memoryview(state)
+        self._tx_lock = lock
+
+    def _detach_buffers(self):
+        """
+        Gives a disconnected controller private copies of the shared buffers, so it
+        can no longer change the channels of controllers still using the port.
+        """
+        # current_state already holds any staged batch changes; keep them locally
+        self._batch_staged_from = None
+        self._use_buffers(
+            bytearray(self.current_state), bytearray(self._packet), threading.Lock()
+        )
+
+    def _start_tx_thread(self):
+        """
+        Starts the background writer thread (see _tx_loop).
+        """
+        self._tx_stop = False
+        self._tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+        self._tx_thread.start()
+
+    def _tx_loop(self):
+        """
+        Background writer used when threaded=True. Sleeps until a send is requested,
+        then writes the latest state; requests made while it is busy coalesce into one write.
+        A request that arrives while a batch() is open is held back, as current_state may
+        be half applied, and marks the batch dirty so end_batch() sends it.
+        With refresh_rate set, it also re-sends the frame whenever a refresh period passes
+        without a requested send.
+        """
+        interval = 1.0 / self.refresh_rate if self.refresh_rate else None
+        while True:
+            requested = self._tx_event.wait(interval)
+            self._tx_event.clear()
+            with self._tx_lock:
+                force, self._tx_force = self._tx_force, False
+                if self.serial_port:
+                    if requested and self._batch_depth:
+                        self._batch_dirty = True
+                        self._tx_force = force
+                    elif requested:
+                        self._write_frame(force)
+                    else:
+                        self._refresh_frame()
+            if self._tx_stop:
+                return
+
+    def _refresh_frame(self):
+        """
+        Re-sends the last frame written, for refresh_rate. The packet is resent as-is and
+        never rebuilt from current_state, so a refresh during a batch() cannot expose a
+        half-applied state. When the port has a raw descriptor it goes straight to
+        os.write, skipping pyserial's per-call timeout and bookkeeping.
+        """
+        if not self._synced:
+            # No frame has reached the port yet (or the last write failed)
+            if not self._batch_depth:
+                self._write_frame(force=True)
+            return
+        if self._fd is None:
+            self._write_packet()
+            return
+
+        try:
+            written = os.write(self._fd, self._packet)
+            if written < len(self._packet):
+                # Kernel buffer was full; let pyserial finish the frame with its timeout
+                self.serial_port.write(memoryview(self._packet)[written:])
+        except (serial.SerialException, OSError) as e:
+            _log.error("Error sending DMX packet: %s", e)
+            self._synced = False
+
+    def _write_frame(self, force=False):
+        """
+        Copies the current state into the packet buffer and writes it, unless it
+        matches the last frame sent and force is False. The caller must hold _tx_lock,
+        as the packet and the port may be shared with other controllers.
+
+        Args:
+            force (bool, optional): Write even if nothing changed. Defaults to False.
+        """
+        if not force and self._synced and self._state_view == self.current_state:
+            return
 
-    def send_dmx_packet(self, channel_values=None):
+        # Refresh the channel data in place; the start code at index 0 stays 0
+        self._state_view[:] = self.current_state
+        self._write_packet()
+
+    def _write_packet(self):
+        """
+        Writes the packet buffer as-is and records whether it reached the port.
+        The caller must hold _tx_lock.
+        """
+        try:
+            self.serial_port.write(self._packet)
+            self._synced = True
+        except (serial.SerialException, OSError) as e:
+            _log.error("Error sending DMX packet: %s", e)
+            self._synced = False
+
+    def send_dmx_packet(self, channel_values=None, force=False):
         """
         Sends a DMX packet to the device.
 
+        The write is skipped when the resulting channel data is identical to the last
+        frame sent, unless force is True. With threaded=True the write is handed to the
+        background writer and this call returns immediately. Inside a batch() block
+        the values are applied and the frame is sent when the batch exits.
+
         Args:
             channel_values (dict, optional): A dictionary where keys are channel numbers (1-based)
                                              and values are the desired values (0-255).
                                              If None, sends the current state. Defaults to None.
+            force (bool, optional): Send the packet even if nothing changed (e.g., as a keepalive).
+                                    Defaults to False.
         """
-        if not self.serial_port:
-            print("Error: Not connected to a DMX device.")
+        if not (self.serial_port or self._batch_depth or self.offline):
+            _log.error("Not connected to a DMX device.")
             return
 
         if channel_values:
@@ -96,28 +799,189 @@ class DmxController:
                 if 1 <= channel <= self.num_channels and 0 <= value <= 255:
                     self.current_state[channel - 1] = value
                 else:
-                    print(
-                        f"Warning: Invalid channel ({channel}) or value ({value}). Skipping."
+                    _log.warning(
+                        "Invalid channel (%s) or value (%s). Skipping.", channel, value
                     )
 
-        # Construct the DMX packet: Start Code + Channel Data
-        packet = bytearray([0x00])  # DMX start code is always 0
-        packet.extend(self.current_state)
+        if self._batch_depth:
+            self._batch_dirty = True
+        elif self.serial_port:
+            self._send_current(force)
+
+    def _send_current(self, force=False):
+        """
+        Sends current_state without validating anything; the caller must ensure the port is open.
 
+        Args:
+            force (bool, optional): Send even if nothing changed. Defaults to False.
+        """
+        if self._tx_thread:
+            if force:
+                self._tx_force = True
+            self._tx_event.set()
+        else:
+            with self._tx_lock:
+                self._write_frame(force)
+
+    def begin_batch(self):
+        """
+        Starts deferring packet sends until the matching end_batch() call.
+        Prefer the batch() context manager, which always ends the batch.
+        """
+        # Under the write lock, so the writer thread is never mid-frame when a batch opens
+        with self._tx_lock:
+            if self._batch_depth == 0 and self._shared_port:
+                # Stage changes in a private copy, so other controllers on the port
+                # cannot send them before the batch ends
+                shared = self.current_state
+                self._batch_staged_from = (shared, bytes(shared))
+                self.current_state = bytearray(shared)
+                self._state_mv = memoryview(self.current_state)
+            self._batch_depth += 1
+
+    def end_batch(self):
+        """
+        Ends a batch started with begin_batch(). When the outermost batch ends and
+        any channel changed, the new state is sent as a single frame and flushed.
+        """
+        if self._batch_depth == 0:
+            _log.warning("end_batch() called without a matching begin_batch().")
+            return
+
+        with self._tx_lock:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_staged_from:
+                self._commit_staged()
+            send = self._batch_depth == 0 and self._batch_dirty
+            if send:
+                self._batch_dirty = False
+        if send:
+            self.send_dmx_packet()
+            if self.serial_port and not self._tx_thread:
+                try:
+                    self.serial_port.flush()
+                except (serial.SerialException, OSError) as e:
+                    _log.error("Error flushing DMX packet: %s", e)
+
+    def _commit_staged(self):
+        """
+        Copies the channels a batch changed from its private copy into the port's
+        shared state and switches back to it. Channels the batch left at their starting
+        value are not written, so changes other controllers made meanwhile survive.
+        The caller must hold _tx_lock.
+        """
+        shared, start = self._batch_staged_from
+        staged = self.current_state
+        for idx in range(self.num_channels):
+            if staged[idx] != start[idx]:
+                shared[idx] = staged[idx]
+        self._batch_staged_from = None
+        self.current_state = shared
+        self._state_mv = memoryview(shared)
+
+    @contextmanager
+    def batch(self):
+        """
+        Defers packet sends until the block exits, so several channel changes go out
+        as a single DMX frame. Batches may be nested; only the outermost one sends.
+        Other controllers sharing the port do not see the changes until the batch exits.
+
+        Example:
+            with controller.batch():
+                controller.select_gallery(1)
+                controller.select_pattern(1, 5)
+        """
+        self.begin_batch()
         try:
-            self.serial_port.write(packet)
-        except serial.SerialException as e:
-            print(f"Error sending DMX packet: {e}")
+            yield self
+        finally:
+            self.end_batch()
 
     def set_channel(self, channel, value):
         """
         Sets the value of a single DMX channel and sends an update.
+        Inside a batch() block the update is sent when the batch exits.
 
         Args:
             channel (int): The DMX channel number (1-based).
             value (int): The value to set (0-255).
         """
-        self.send_dmx_packet({channel: value})
+        if not (1 <= channel <= self.num_channels and 0 <= value <= 255):
+            _log.warning(
+                "Invalid channel (%s) or value (%s). Skipping.", channel, value
+            )
+            return
+
+        self._set_raw(channel - 1, value)
+
+    def _set_raw(self, idx, value):
+        """
+        Sets a channel by 0-based index and sends an update (deferred inside a
+        batch() block). The caller guarantees 0 <= idx and 0 <= value <= 255; the
+        fixed channels used by the setters may still lie beyond num_channels.
+
+        Args:
+            idx (int): The 0-based channel index.
+            value (int): The value to set (0-255).
+        """
+        if idx >= self.num_channels:
+            _log.warning(
+                "Invalid channel (%s) or value (%s). Skipping.", idx + 1, value
+            )
+            return
+        if not (self.serial_port or self._batch_depth or self.offline):
+            _log.error("Not connected to a DMX device.")
+            return
+
+        self.current_state[idx] = value
+        if self._batch_depth:
+            self._batch_dirty = True
+        elif self._synced and not self._tx_thread:
+            # The packet already mirrors every other channel; patch one byte and resend
+            with self._tx_lock:
+                if self._packet[idx + 1] != value:
+                    self._packet[idx + 1] = value
+                    self._write_packet()
+        elif self.serial_port:
+            self._send_current()
+
+    def apply_state(self, values):
+        """
+        Replaces the state of all channels at once and sends a single frame
+        (deferred inside a batch() block).
+
+        For fades and chases, build each frame in a reusable buffer such as
+        np.zeros(num_channels, dtype=np.uint8) and pass it here once per frame;
+        the copy is a single C-level operation instead of one set_channel call per channel.
+
+        Args:
+            values (bytes-like or sequence of int): Exactly num_channels values (0-255).
+        """
+        # bytes(n) would silently build n zero bytes from a single integer
+        if isinstance(values, numbers.Integral):
+            _log.warning("Channel values must be integers between 0 and 255.")
+            return
+        try:
+            data = bytes(values)
+        except (TypeError, ValueError):
+            _log.warning("Channel values must be integers between 0 and 255.")
+            return
+        if len(data) != self.num_channels:
+            _log.warning(
+                "Expected %s channel values (one byte each), got %s.",
+                self.num_channels,
+                len(data),
+            )
+            return
+        if not (self.serial_port or self._batch_depth or self.offline):
+            _log.error("Not connected to a DMX device.")
+            return
+
+        self.current_state[:] = data
+        if self._batch_depth:
+            self._batch_dirty = True
+        elif self.serial_port:
+            self._send_current()
 
     def get_channel_value(self, channel):
         """
@@ -129,11 +993,41 @@ class DmxController:
           int: The current DMX channel value.
         """
         if 1 <= channel <= self.num_channels:
-            return self.current_state[channel - 1]
+            return self._state_mv[channel - 1]
         else:
-            print(f"Warning: Invalid channel number: {channel}")
+            _log.warning("Invalid channel number: %s", channel)
             return None
 
+    def _set_ranged(self, idx, modes, choices, mode, value):
+        """
+        Validates a mode/value pair against a mode table of (min, max) ranges and sets the channel.
+
+        Args:
+            idx (int): The 0-based channel index.
+            modes (dict): Mode name -> (min, max) value range.
+            choices (str): The mode names joined for error messages.
+            mode (str): The requested mode.
+            value (int, optional): A value within the mode's range. If None, the minimum is used.
+        """
+        mode_range = modes.get(mode)
+        if mode_range is None:
+            _log.warning("Invalid mode: %s. Choose from: %s", mode, choices)
+            return
+
+        lo, hi = mode_range
+        if value is None:
+            value = lo
+            _log.debug(
+                "Using default value %s for %s (range: %s-%s)", value, mode, lo, hi
+            )
+        elif not (lo <= value <= hi):
+            _log.warning(
+                "Value %s is out of range for %s (range: %s-%s)", value, mode, lo, hi
+            )
+            return
+
+        self._set_raw(idx, value)
+
     # --- Specific Laser Functions ---
 
     def set_lamp_mode(self, mode):
@@ -144,28 +1038,22 @@ class DmxController:
             mode (str): 'off', 'manual', 'dynamic_sound', 'tune_program',
                         'sound_program', 'off_end'
         """
-        modes = {
-            "off": 0,
-            "manual": (1, 99),  # Range for manual mode
-            "dynamic_sound": (100, 199),  # Range for dynamic sound control
-            "tune_program": (200, 219),  # Range for tuning program library
-            "sound_program": (220, 249),  # Range for sound-control program library
-            "off_end": (250, 255),  # Off at the end of the range
-        }
-
-        if mode not in modes:
-            print(f"Invalid mode: {mode}. Choose from: {', '.join(modes.keys())}")
+        if mode not in _LAMP_MODES:
+            _log.warning("Invalid mode: %s. Choose from: %s", mode, _LAMP_MODES_STR)
             return
 
-        value = modes[mode]
+        value = _LAMP_MODES[mode]
         if isinstance(value, tuple):
             # If it's a range, you might want to choose a specific value or prompt the user
-            print(
-                f"Mode '{mode}' requires a value between {value[0]} and {value[1]}. Using the minimum value."
+            _log.debug(
+                "Mode '%s' requires a value between %s and %s. Using the minimum value.",
+                mode,
+                value[0],
+                value[1],
             )
             value = value[0]
 
-        self.set_channel(1, value)
+        self._set_raw(self._CH_LAMP, value)
 
     def set_pattern_size(self, laser_num, size_mode, value=None):
         """
@@ -178,38 +1066,16 @@ class DmxController:
                                    a default value will be used based on the mode.
         """
         if laser_num not in (1, 2):
-            print("Invalid laser number. Must be 1 or 2.")
-            return
-
-        channel = 2 if laser_num == 1 else 19
-
-        modes = {
-            "parts_blank": (0, 49),
-            "returns": (50, 99),
-            "folds": (100, 149),
-            "crossing": (150, 199),
-            "blanking": (200, 255),
-        }
-
-        if size_mode not in modes:
-            print(
-                f"Invalid size mode: {size_mode}. Choose from: {', '.join(modes.keys())}"
-            )
+            _log.warning("Invalid laser number. Must be 1 or 2.")
             return
 
-        mode_range = modes[size_mode]
-        if value is None:
-            value = mode_range[0]  # Default to the beginning of the range
-            print(
-                f"Using default value {value} for {size_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {size_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(channel, value)
+        self._set_ranged(
+            self._CH_PATTERN_SIZE[0 if laser_num == 1 else 1],
+            _PATTERN_SIZE_MODES,
+            _PATTERN_SIZE_MODES_STR,
+            size_mode,
+            value,
+        )
 
     def select_gallery(self, gallery_num):
         """
@@ -218,12 +1084,12 @@ class DmxController:
         Args:
             gallery_num (int): 0 for Beam gallery, 1 for Animation gallery.
         """
-        if gallery_num == 0:
-            self.set_channel(3, 0)  # Beam gallery
-        elif gallery_num == 1:
-            self.set_channel(3, 240)  # Animation gallery
-        else:
-            print("Invalid gallery number. Must be 0 or 1.")
+        value = _GALLERY_VALUES.get(gallery_num)
+        if value is None:
+            _log.warning("Invalid gallery number. Must be 0 or 1.")
+            return
+
+        self._set_raw(self._CH_GALLERY, value)
 
     def select_pattern(self, laser_num, pattern_index):
         """
@@ -233,8 +1099,11 @@ class DmxController:
             laser_num (int): The laser number (1 or 2).
             pattern_index (int): The index of the pattern (0 to play all in order, or a specific index).
         """
-        channel = 4 if laser_num == 1 else 21
-        self.set_channel(channel, pattern_index)
+        if not (0 <= pattern_index <= 255):
+            _log.warning("Pattern index must be between 0 and 255.")
+            return
+
+        self._set_raw(self._CH_PATTERN[0 if laser_num == 1 else 1], pattern_index)
 
     def set_pattern_zooming(self, laser_num, zoom_mode, value=None):
         """
@@ -246,34 +1115,13 @@ class DmxController:
             value (int, optional): A specific value within the mode's range. If None,
                                     a default value will be used based on the mode.
         """
-        channel = 5 if laser_num == 1 else 22
-
-        modes = {
-            "static": (0, 127),
-            "zoom_in": (128, 159),
-            "zoom_out": (160, 191),
-            "flip_zooming": (192, 255),
-        }
-
-        if zoom_mode not in modes:
-            print(
-                f"Invalid zoom mode: {zoom_mode}. Choose from: {', '.join(modes.keys())}"
-            )
-            return
-
-        mode_range = modes[zoom_mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {zoom_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {zoom_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(channel, value)
+        self._set_ranged(
+            self._CH_PATTERN_ZOOMING[0 if laser_num == 1 else 1],
+            _PATTERN_ZOOMING_MODES,
+            _PATTERN_ZOOMING_MODES_STR,
+            zoom_mode,
+            value,
+        )
 
     def set_pattern_rotation(self, laser_num, rotation_mode, value=None):
         """
@@ -286,35 +1134,13 @@ class DmxController:
                                    a default value will be used based on the mode.
         """
 
-        channel = 6 if laser_num == 1 else 23
-
-        modes = {
-            "static": (0, 127),
-            "dynamic_inversion": (
-                128,
-                255,
-            ),  # This mode has two ranges in the CSV, assuming they both use same function
-        }
-
-        if rotation_mode not in modes:
-            print(
-                f"Invalid rotation mode: {rotation_mode}. Choose from: {', '.join(modes.keys())}"
-            )
-            return
-
-        mode_range = modes[rotation_mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {rotation_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {rotation_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(channel, value)
+        self._set_ranged(
+            self._CH_PATTERN_ROTATION[0 if laser_num == 1 else 1],
+            _PATTERN_ROTATION_MODES,
+            _PATTERN_ROTATION_MODES_STR,
+            rotation_mode,
+            value,
+        )
 
     def set_horizontal_movement(self, laser_num, movement_mode, value=None):
         """
@@ -326,35 +1152,13 @@ class DmxController:
             value (int, optional): A specific value within the mode's range. If None,
                                    a default value will be used based on the mode.
         """
-        channel = 7 if laser_num == 1 else 24
-
-        modes = {
-            "static": (0, 127),
-            "push_up": (128, 159),
-            "push_down": (160, 191),
-            "left_shift": (192, 223),
-            "right_shift": (224, 255),
-        }
-
-        if movement_mode not in modes:
-            print(
-                f"Invalid movement mode: {movement_mode}. Choose from: {', '.join(modes.keys())}"
-            )
-            return
-
-        mode_range = modes[movement_mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {movement_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {movement_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(channel, value)
+        self._set_ranged(
+            self._CH_HORIZONTAL_MOVEMENT[0 if laser_num == 1 else 1],
+            _HORIZONTAL_MOVEMENT_MODES,
+            _HORIZONTAL_MOVEMENT_MODES_STR,
+            movement_mode,
+            value,
+        )
 
     def set_vertical_movement(self, laser_num, movement_mode, value=None):
         """
@@ -366,35 +1170,13 @@ class DmxController:
             value (int, optional): A specific value within the mode's range. If None,
                                    a default value will be used based on the mode.
         """
-        channel = 8 if laser_num == 1 else 25
-
-        modes = {
-            "static": (0, 127),
-            "right_push": (128, 159),
-            "left_push": (160, 191),
-            "move_up": (192, 223),
-            "move_down": (224, 255),
-        }
-
-        if movement_mode not in modes:
-            print(
-                f"Invalid movement mode: {movement_mode}. Choose from: {', '.join(modes.keys())}"
-            )
-            return
-
-        mode_range = modes[movement_mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {movement_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {movement_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(channel, value)
+        self._set_ranged(
+            self._CH_VERTICAL_MOVEMENT[0 if laser_num == 1 else 1],
+            _VERTICAL_MOVEMENT_MODES,
+            _VERTICAL_MOVEMENT_MODES_STR,
+            movement_mode,
+            value,
+        )
 
     def set_horizontal_zooming(self, zoom_mode, value=None):
         """
@@ -405,33 +1187,13 @@ class DmxController:
             value (int, optional): A specific value within the mode's range. If None,
                                    a default value will be used based on the mode.
         """
-        modes = {
-            "static": (0, 127),
-            "push_up_distortion": (128, 159),
-            "push_down_distortion": (160, 191),
-            "zooming": (192, 223),
-            "flip_zooming": (224, 255),
-        }
-
-        if zoom_mode not in modes:
-            print(
-                f"Invalid zoom mode: {zoom_mode}. Choose from: {', '.join(modes.keys())}"
-            )
-            return
-
-        mode_range = modes[zoom_mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {zoom_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {zoom_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(9, value)
+        self._set_ranged(
+            self._CH_HORIZONTAL_ZOOMING,
+            _HORIZONTAL_ZOOMING_MODES,
+            _HORIZONTAL_ZOOMING_MODES_STR,
+            zoom_mode,
+            value,
+        )
 
     def set_vertical_zooming(self, zoom_mode, value=None):
         """
@@ -442,33 +1204,13 @@ class DmxController:
             value (int, optional): A specific value within the mode's range. If None,
                                    a default value will be used based on the mode.
         """
-        modes = {
-            "static": (0, 127),
-            "right_push_distortion": (128, 159),
-            "left_push_distortion": (160, 191),
-            "zoom": (192, 223),
-            "dynamic_flip_zooming": (224, 255),
-        }
-
-        if zoom_mode not in modes:
-            print(
-                f"Invalid zoom mode: {zoom_mode}. Choose from: {', '.join(modes.keys())}"
-            )
-            return
-
-        mode_range = modes[zoom_mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {zoom_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {zoom_mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(10, value)
+        self._set_ranged(
+            self._CH_VERTICAL_ZOOMING,
+            _VERTICAL_ZOOMING_MODES,
+            _VERTICAL_ZOOMING_MODES_STR,
+            zoom_mode,
+            value,
+        )
 
     def set_forced_color(self, laser_num, mode, value=None):
         """
@@ -479,20 +1221,22 @@ class DmxController:
             mode (str): 'primary', 'change_every_n'.
             value (int, optional): For 'change_every_n', the value of N.
         """
-        channel = 11 if laser_num == 1 else 28
+        spec = _FORCED_COLOR_MODES.get(mode)
+        if spec is None:
+            _log.warning("Invalid mode. Choose from 'primary', 'change_every_n'.")
+            return
 
-        if mode == "primary":
-            self.set_channel(channel, 0)
-        elif mode == "change_every_n":
-            if value is None:
-                print("For 'change_every_n' mode, you must specify a value for N.")
-                return
-            if not (1 <= value <= 255):
-                print("Value for 'change_every_n' must be between 1 and 255.")
-                return
-            self.set_channel(channel, value)
-        else:
-            print("Invalid mode. Choose from 'primary', 'change_every_n'.")
+        lo, hi, fixed = spec
+        if fixed is not None:
+            value = fixed
+        elif value is None:
+            _log.warning("For '%s' mode, you must specify a value for N.", mode)
+            return
+        elif not (lo <= value <= hi):
+            _log.warning("Value for '%s' must be between %s and %s.", mode, lo, hi)
+            return
+
+        self._set_raw(self._CH_FORCED_COLOR[0 if laser_num == 1 else 1], value)
 
     def set_strobe_flash(self, mode, value=None):
         """
@@ -502,32 +1246,13 @@ class DmxController:
             mode (str): 'off', 'strobe', 'random_flash', 'sound_strobe', 'sound_random_flash', 'on'.
             value (int, optional): For modes with a range, a specific value within that range.
         """
-        modes = {
-            "off": (0, 15),
-            "strobe": (16, 131),
-            "random_flash": (132, 147),
-            "sound_strobe": (148, 199),
-            "sound_random_flash": (200, 215),
-            "on": (216, 255),
-        }
-
-        if mode not in modes:
-            print(f"Invalid mode: {mode}. Choose from: {', '.join(modes.keys())}")
-            return
-
-        mode_range = modes[mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(12, value)
+        self._set_ranged(
+            self._CH_STROBE_FLASH,
+            _STROBE_FLASH_MODES,
+            _STROBE_FLASH_MODES_STR,
+            mode,
+            value,
+        )
 
     def set_node_highlighting(self, laser_num, mode, value=None):
         """
@@ -539,34 +1264,13 @@ class DmxController:
             value (int, optional): A specific value within the mode's range. If None,
                                    a default value will be used based on the mode.
         """
-        channel = 13 if laser_num == 1 else 30
-
-        modes = {
-            "brighter": (0, 63),
-            "broken_lines": (64, 127),
-            "scanning_line": (
-                128,
-                223,
-            ),  # The CSV lists 128-159, but with 224-255 reserved, it is likely a typo.
-        }
-
-        if mode not in modes:
-            print(f"Invalid mode: {mode}. Choose from: {', '.join(modes.keys())}")
-            return
-
-        mode_range = modes[mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(channel, value)
+        self._set_ranged(
+            self._CH_NODE_HIGHLIGHTING[0 if laser_num == 1 else 1],
+            _NODE_HIGHLIGHTING_MODES,
+            _NODE_HIGHLIGHTING_MODES_STR,
+            mode,
+            value,
+        )
 
     def set_node_expansion(self, laser_num, expansion_value, delay_value=None):
         """
@@ -578,22 +1282,24 @@ class DmxController:
             delay_value (int, optional): The delay after full expansion (0-255).
                                           Required if CH15 is >= 128.
         """
-        channel = 14 if laser_num == 1 else 31
+        idx = self._CH_NODE_EXPANSION[0 if laser_num == 1 else 1]
+        drawing_idx = self._CH_GRADUAL_DRAWING[0 if laser_num == 1 else 1]
 
         if not (0 <= expansion_value <= 255):
-            print("Expansion value must be between 0 and 255.")
+            _log.warning("Expansion value must be between 0 and 255.")
             return
 
-        if self.get_channel_value(15 if laser_num == 1 else 32) >= 128:
+        # A gradual drawing channel beyond num_channels reads as 0
+        if drawing_idx < self.num_channels and self._state_mv[drawing_idx] >= 128:
             if delay_value is None:
-                print("Delay value is required when CH15 is >= 128.")
+                _log.warning("Delay value is required when CH15 is >= 128.")
                 return
             if not (0 <= delay_value <= 255):
-                print("Delay value must be between 0 and 255.")
+                _log.warning("Delay value must be between 0 and 255.")
                 return
-            self.set_channel(channel, delay_value)
+            self._set_raw(idx, delay_value)
         else:
-            self.set_channel(channel, expansion_value)
+            self._set_raw(idx, expansion_value)
 
     def set_gradual_drawing(self, laser_num, mode, manual_expansion_value=None):
         """
@@ -605,44 +1311,37 @@ class DmxController:
             manual_expansion_value (int, optional):  Required for 'forward_manual' and 'reverse_manual' modes.
                                                     Must be used with channel 14.
         """
-        channel = 15 if laser_num == 1 else 32
+        idx = self._CH_GRADUAL_DRAWING[0 if laser_num == 1 else 1]
 
-        modes = {
-            "forward_manual": (0, 63),
-            "reverse_manual": (64, 127),
-            "dynamic_A": (128, 159),
-            "dynamic_B": (160, 191),
-            "dynamic_C": (192, 223),
-            "dynamic_D": (224, 255),
-        }
-
-        if mode not in modes:
-            print(f"Invalid mode: {mode}. Choose from: {', '.join(modes.keys())}")
+        if mode not in _GRADUAL_DRAWING_MODES:
+            _log.warning(
+                "Invalid mode: %s. Choose from: %s", mode, _GRADUAL_DRAWING_MODES_STR
+            )
             return
 
-        mode_range = modes[mode]
+        mode_range = _GRADUAL_DRAWING_MODES[mode]
 
         if mode in ("forward_manual", "reverse_manual"):
             if manual_expansion_value is None:
-                print(f"Manual expansion value is required for '{mode}' mode.")
+                _log.warning("Manual expansion value is required for '%s' mode.", mode)
                 return
             if not (
                 0 <= manual_expansion_value <= (127 if mode == "forward_manual" else 63)
             ):
-                print(f"Manual expansion value is out of range for '{mode}'.")
+                _log.warning("Manual expansion value is out of range for '%s'.", mode)
+                return
+            # When channel 14/31 is beyond num_channels, so is this one; _set_raw warns
+            expansion_idx = self._CH_NODE_EXPANSION[0 if laser_num == 1 else 1]
+            if expansion_idx < self.num_channels and self._state_mv[expansion_idx] == 0:
+                _log.warning(
+                    "Must set channel %s before using manual expansion.",
+                    expansion_idx + 1,
+                )
                 return
-            if laser_num == 1:
-                if self.get_channel_value(14) == 0:
-                    print("Must set channel 14 before using manual expansion.")
-                    return
-            elif laser_num == 2:
-                if self.get_channel_value(31) == 0:
-                    print("Must set channel 31 before using manual expansion.")
-                    return
 
-            self.set_channel(channel, manual_expansion_value)
+            self._set_raw(idx, manual_expansion_value)
         else:
-            self.set_channel(channel, mode_range[0])
+            self._set_raw(idx, mode_range[0])
 
     def set_distortion_degree(self, laser_num, degree):
         """
@@ -652,13 +1351,13 @@ class DmxController:
             laser_num (int): The laser number (1 or 2, where 2 is the second picture).
             degree (int): The degree of distortion (0-255).
         """
-        channel = 16 if laser_num == 1 else 17
+        idx = self._CH_DISTORTION_DEGREE[0 if laser_num == 1 else 1]
 
         if not (0 <= degree <= 255):
-            print("Degree of distortion must be between 0 and 255.")
+            _log.warning("Degree of distortion must be between 0 and 255.")
             return
 
-        self.set_channel(channel, degree)
+        self._set_raw(idx, degree)
 
     def set_second_lamp_pattern(self, pattern_value):
         """
@@ -668,10 +1367,10 @@ class DmxController:
             pattern_value (int): 0 for Off, 1-255 to light up the second pattern.
         """
         if not (0 <= pattern_value <= 255):
-            print("Pattern value must be between 0 and 255.")
+            _log.warning("Pattern value must be between 0 and 255.")
             return
 
-        self.set_channel(18, pattern_value)
+        self._set_raw(self._CH_SECOND_LAMP_PATTERN, pattern_value)
 
     def set_pattern_library_selection(self, mode):
         """
@@ -680,12 +1379,12 @@ class DmxController:
         Args:
             mode (str): Currently, only 'default' is supported based on the documentation.
         """
-        if mode == "default":
-            self.set_channel(
-                20, 0
-            )  # using the beam library by default and has no function
-        else:
-            print("Invalid mode. Only 'default' is supported.")
+        value = _PATTERN_LIBRARY_MODES.get(mode)
+        if value is None:
+            _log.warning("Invalid mode. Only 'default' is supported.")
+            return
+
+        self._set_raw(self._CH_PATTERN_LIBRARY, value)
 
     def set_horizontal_flip(self, mode, value=None):
         """
@@ -696,30 +1395,13 @@ class DmxController:
             value (int, optional): A specific value within the mode's range. If None,
                                    a default value will be used based on the mode.
         """
-        modes = {
-            "static": (0, 127),
-            "push_up_distortion": (128, 159),
-            "push_down_distortion": (160, 191),
-            "flip": (192, 223),
-        }
-
-        if mode not in modes:
-            print(f"Invalid mode: {mode}. Choose from: {', '.join(modes.keys())}")
-            return
-
-        mode_range = modes[mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(26, value)
+        self._set_ranged(
+            self._CH_HORIZONTAL_FLIP,
+            _HORIZONTAL_FLIP_MODES,
+            _HORIZONTAL_FLIP_MODES_STR,
+            mode,
+            value,
+        )
 
     def set_vertical_flip(self, mode, value=None):
         """
@@ -730,30 +1412,13 @@ class DmxController:
             value (int, optional): A specific value within the mode's range. If None,
                                    a default value will be used based on the mode.
         """
-        modes = {
-            "static": (0, 127),
-            "right_push_distortion": (128, 159),
-            "left_push_distortion": (160, 191),
-            "flip": (192, 255),
-        }
-
-        if mode not in modes:
-            print(f"Invalid mode: {mode}. Choose from: {', '.join(modes.keys())}")
-            return
-
-        mode_range = modes[mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(27, value)
+        self._set_ranged(
+            self._CH_VERTICAL_FLIP,
+            _VERTICAL_FLIP_MODES,
+            _VERTICAL_FLIP_MODES_STR,
+            mode,
+            value,
+        )
 
     def set_color_change(self, mode, value=None):
         """
@@ -766,40 +1431,13 @@ class DmxController:
             value (int, optional): A specific value within the mode's range. If None,
                                    a default value will be used based on the mode.
         """
-        modes = {
-            "primary": (0, 7),
-            "white": (8, 15),
-            "red": (16, 23),
-            "yellow": (24, 31),
-            "green": (32, 39),
-            "indigo": (40, 47),
-            "blue": (48, 55),
-            "purple": (56, 63),
-            "rgb_cycle": (64, 95),
-            "yip_cycle": (96, 127),
-            "full_color_cycle": (128, 159),
-            "colorful_change": (160, 191),
-            "forward_movement": (192, 223),
-            "reverse_movement": (224, 255),
-        }
-
-        if mode not in modes:
-            print(f"Invalid mode: {mode}. Choose from: {', '.join(modes.keys())}")
-            return
-
-        mode_range = modes[mode]
-        if value is None:
-            value = mode_range[0]
-            print(
-                f"Using default value {value} for {mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-        elif not (mode_range[0] <= value <= mode_range[1]):
-            print(
-                f"Value {value} is out of range for {mode} (range: {mode_range[0]}-{mode_range[1]})"
-            )
-            return
-
-        self.set_channel(29, value)
+        self._set_ranged(
+            self._CH_COLOR_CHANGE,
+            _COLOR_CHANGE_MODES,
+            _COLOR_CHANGE_MODES_STR,
+            mode,
+            value,
+        )
 
     def blackout(self):
         """
@@ -812,9 +1450,10 @@ class DmxController:
     def reset_all_channels(self):
         """
         Resets all DMX channels to their default values (usually 0).
+        Inside a batch() block the update is sent when the batch exits.
         """
-        all_channels_zero = {i: 0 for i in range(1, self.num_channels + 1)}
-        self.send_dmx_packet(all_channels_zero)
+        self.current_state[:] = bytes(self.num_channels)
+        self.send_dmx_packet()
 
     def get_current_state(self):
         """
@@ -823,4 +1462,4 @@ class DmxController:
         Returns:
             list: A list representing the current values of all DMX channels (0-255).
         """
-        return self.current_state
+        return list(self.current_state)
@@ -0,0 +1,151 @@
+import multiprocessing
+import queue
+import serial
+
+
+def _serial_worker(port, baudrate, write_timeout, cmd_q, status_q):
+    """
+    Owns the serial port in a child process and writes the DMX frames it receives.
+
+    Frames always carry the full channel state, so when several are queued only the
+    newest one is written. A None command closes the port and ends the process.
+
+    Args:
+        port (str): The serial port to open.
+        baudrate (int): The baud rate for serial communication.
+        write_timeout (float): Maximum time a frame write may block, in seconds.
+        cmd_q (multiprocessing.Queue): Incoming frames (bytes), or None to stop.
+        status_q (multiprocessing.Queue): Receives None once the port is open, or an error message;
+                                          then an error message for each failed write.
+    """
+    try:
+        ser = serial.Serial(
+            port=port,
+            baudrate=baudrate,
+            write_timeout=write_timeout,
+            rtscts=False,
+            dsrdtr=False,
+        )
+        ser.reset_output_buffer()
+    except serial.SerialException as e:
+        status_q.put(str(e))
+        return
+    status_q.put(None)
+
+    try:
+        while True:
+            frame = cmd_q.get()
+            stop = frame is None
+            while not stop:
+                try:
+                    newer = cmd_q.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    stop = True
+                else:
+                    frame = newer
+
+            if frame is not None:
+                try:
+                    ser.write(frame)
+                    ser.flush()
+                except serial.SerialException as e:
+                    # The child may have no logging set up (spawn); let the parent raise it
+                    status_q.put(str(e))
+            if stop:
+                return
+    finally:
+        ser.close()
+
+
+class SerialProcess:
+    """
+    Parent-side handle for a serial port owned by a _serial_worker child process.
+    write() only enqueues the frame, so callers never block on USB or hold the GIL
+    while the device is written.
+    """
+
+    def __init__(self, port, baudrate=250000, write_timeout=0.1, open_timeout=5):
+        """
+        Starts the worker process and waits until it has opened the port.
+
+        Args:
+            port (str): The serial port to open.
+            baudrate (int, optional): The baud rate for serial communication. Defaults to 250000.
+            write_timeout (float, optional): Maximum time a frame write may block in the worker,
+                                             in seconds. Defaults to 0.1.
+            open_timeout (float, optional): How long to wait for the port to open, in seconds.
+                                            Defaults to 5.
+
+        Raises:
+            serial.SerialException: If the worker could not open the port.
+        """
+        self.port = port
+        self._cmd_q = multiprocessing.Queue()
+        self._status_q = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_serial_worker,
+            args=(port, baudrate, write_timeout, self._cmd_q, self._status_q),
+            daemon=True,
+        )
+        self._process.start()
+
+        try:
+            error = self._status_q.get(timeout=open_timeout)
+        except queue.Empty:
+            error = "Timed out waiting for the serial worker to open the port."
+        if error is not None:
+            # Also stops a worker that is still trying to open the port
+            self._process.terminate()
+            self._process.join(timeout=1)
+            raise serial.SerialException(error)
+        self.is_open = True
+
+    def write(self, data):
+        """
+        Queues a frame for the worker. Writes happen asynchronously, so a frame the worker
+        failed to write is reported by the next call to write().
+
+        Args:
+            data (bytes-like): The frame to send. It is copied, so the caller may reuse its buffer.
+
+        Returns:
+            int: The number of bytes queued.
+
+        Raises:
+            serial.SerialException: If the worker process has exited, or failed to write
+                                    an earlier frame (this frame is then not queued).
+        """
+        if not self._process.is_alive():
+            self.is_open = False
+            raise serial.SerialException("The serial worker process has exited.")
+        error = None
+        try:
+            while True:
+                error = self._status_q.get_nowait()
+        except queue.Empty:
+            pass
+        if error is not None:
+            raise serial.SerialException(error)
+        self._cmd_q.put_nowait(bytes(data))
+        return len(data)
+
+    def flush(self):
+        """
+        No-op; the worker flushes after every frame it writes.
+        """
+
+    def close(self):
+        """
+        Sends any queued frame, then stops the worker and closes the port. A worker
+        still stuck in a write after a second is terminated.
+        """
+        if not self.is_open:
+            return
+        self.is_open = False
+        self._cmd_q.put(None)
+        self._process.join(timeout=1)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=1)
@@ -1,71 +1,113 @@
 from py.controller import DmxController
-import sys
+import argparse
+import asyncio
+import logging
 import time
 
+_log = logging.getLogger(__name__)
+
+# (delay in seconds after the previous step, message, controller method, *args)
+SCHEDULE = (
+    (
+        0,
+        "Setting lamp mode to dynamic sound control...",
+        "set_lamp_mode",
+        "dynamic_sound",
+    ),
+    (2, "Selecting Animation gallery...", "select_gallery", 1),
+    (2, "Selecting pattern 5...", "select_pattern", 1, 5),
+    (
+        2,
+        "Setting pattern size to 'crossing' with value 175...",
+        "set_pattern_size",
+        1,
+        "crossing",
+        175,
+    ),
+    (2, "Setting pattern zooming to 'zoom_in'...", "set_pattern_zooming", 1, "zoom_in"),
+    (
+        2,
+        "Setting pattern rotation to 'dynamic inversion'...",
+        "set_pattern_rotation",
+        1,
+        "dynamic_inversion",
+    ),
+    (
+        2,
+        "Setting pattern horizontal movement to 'left_shift'...",
+        "set_horizontal_movement",
+        1,
+        "left_shift",
+    ),
+    (
+        2,
+        "Setting pattern vertical movement to 'move_up'...",
+        "set_vertical_movement",
+        1,
+        "move_up",
+    ),
+    # Add more steps here to control other features...
+)
+
+
+def _precompute_frames(controller, schedule):
+    """
+    Resolves every schedule step to the full DMX frame it produces, without sending anything.
+
+    The steps run on an offline controller seeded with the connected one's state, so
+    the connected controller (and its refresh thread) never sees an intermediate frame.
+
+    Args:
+        controller (DmxController): The connected controller; its current state is the starting point.
+        schedule (tuple): Steps of (delay, message, method, *args).
 
-def main():
+    Returns:
+        list: One bytes frame (the state of all channels) per step.
     """
-    Main function to demonstrate DMX512LaserController.
+    scratch = DmxController(num_channels=controller.num_channels, offline=True)
+    scratch.current_state[:] = controller.current_state
+    frames = []
+    for _, _, method, *args in schedule:
+        getattr(scratch, method)(*args)
+        frames.append(bytes(scratch.current_state))
+    return frames
+
+
+async def main(refresh_rate=None):
     """
+    Main function to demonstrate DMX512LaserController.
+
+    Runs on asyncio so the holds between steps yield to other tasks (UI, sensors, ...);
+    the controller's background writer keeps USB writes off the event loop.
 
-    print(sys.path)
+    Args:
+        refresh_rate (float, optional): Re-send the frame this many times per second during
+                                        the holds (see DmxController). Only for interfaces
+                                        that frame DMX themselves, so off by default.
+    """
 
     # Create a DMX controller instance.
     # If you know the specific port, you can provide it as an argument:
     # laser_controller = DMX512LaserController(port='/dev/tty.usbmodem14201')
-    laser_controller = DmxController()
+    laser_controller = DmxController(threaded=True, refresh_rate=refresh_rate)
 
     if not laser_controller.serial_port:
-        print("Could not connect to a DMX device. Exiting")
+        _log.error("Could not connect to a DMX device. Exiting")
         return
 
     try:
         # --- Example Usage ---
-
-        # Turn the lamp on to dynamic sound control mode
-        print("Setting lamp mode to dynamic sound control...")
-        laser_controller.set_lamp_mode("dynamic_sound")
-        time.sleep(2)
-
-        # Select the Animation gallery
-        print("Selecting Animation gallery...")
-        laser_controller.select_gallery(1)  # 1 for Animation
-        time.sleep(2)
-
-        # Select pattern number 5 (assuming you know this pattern exists)
-        print("Selecting pattern 5...")
-        laser_controller.select_pattern(1, 5)  # Laser 1, Pattern 5
-        time.sleep(2)
-
-        # Set pattern size to 'crossing' with a specific value
-        print("Setting pattern size to 'crossing' with value 175...")
-        laser_controller.set_pattern_size(1, "crossing", 175)  # Laser 1
-        time.sleep(2)
-
-        # Set pattern zooming to 'zoom_in'
-        print("Setting pattern zooming to 'zoom_in'...")
-        laser_controller.set_pattern_zooming(1, "zoom_in")
-        time.sleep(2)
-
-        # Set pattern rotation to 'dynamic_inversion'
-        print("Setting pattern rotation to 'dynamic inversion'...")
-        laser_controller.set_pattern_rotation(1, "dynamic_inversion")
-        time.sleep(2)
-
-        # Set pattern horizontal movement to 'left_shift'
-        print("Setting pattern horizontal movement to 'left_shift'...")
-        laser_controller.set_horizontal_movement(1, "left_shift")
-        time.sleep(2)
-
-        # Set pattern vertical movement to 'move_up'
-        print("Setting pattern vertical movement to 'move_up'...")
-        laser_controller.set_vertical_movement(1, "move_up")
-        time.sleep(2)
-
-        # Add more commands here to control other features...
-
-    except KeyboardInterrupt:
-        print("Exiting program...")
+        # Every step is resolved to its frame up front, so the timed loop only sends bytes.
+        frames = _precompute_frames(laser_controller, SCHEDULE)
+        deadline = time.monotonic()
+        for (delay, message, *_), frame in zip(SCHEDULE, frames):
+            deadline += delay
+            await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+            laser_controller.apply_state(frame)
+            _log.debug(message)
+
+        # Hold the final look before disconnecting
+        await asyncio.sleep(max(0.0, deadline + 2 - time.monotonic()))
 
     finally:
         # Ensure the connection is closed properly
@@ -73,4 +115,18 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Runs the DMX laser demo sequence.")
+    parser.add_argument(
+        "--refresh-rate",
+        type=float,
+        metavar="HZ",
+        help="continuously re-send the frame at this rate (e.g. 44); only for "
+        "interfaces that frame DMX themselves, not raw FTDI cables",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(main(refresh_rate=args.refresh_rate))
+    except KeyboardInterrupt:
+        _log.info("Exiting program...")
@@ -0,0 +1,121 @@
+"""
+Shared fixtures for the DmxController tests: a fake serial port and a base test case.
+
+Run the tests from the _archive directory, e.g.:
+    python -m unittest py.test.test_shared_port
+"""
+
+import os
+import time
+import unittest
+from unittest import mock
+
+import serial
+
+from py.controller import DmxController
+
+PORT = "/dev/ttyFAKE0"
+PACKET_SIZE = 33  # Start code + 32 channels
+
+
+def wait_until(condition, timeout=2.0, interval=0.001):
+    """
+    Polls condition() until it returns a truthy value or timeout seconds pass.
+
+    Returns:
+        The last value returned by condition().
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        result = condition()
+        if result or time.monotonic() >= deadline:
+            return result
+        time.sleep(interval)
+
+
+class FakeSerial:
+    """
+    Records every frame written, through write() or os.write() on fileno().
+    """
+
+    def __init__(self, port=None, **kwargs):
+        self.port = port
+        self.is_open = True
+        self.dtr = False
+        self.dsr = True
+        self.cts = True
+        self.in_waiting = 0
+        self.writes = []
+        self._raw = b""
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def fileno(self):
+        return self._write_fd
+
+    def reset_input_buffer(self):
+        pass
+
+    def reset_output_buffer(self):
+        pass
+
+    def close(self):
+        if not self.is_open:
+            return
+        self._drain()
+        self.is_open = False
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+    def _drain(self):
+        try:
+            while True:
+                chunk = os.read(self._read_fd, 65536)
+                if not chunk:
+                    break
+                self._raw += chunk
+        except BlockingIOError:
+            pass
+
+    def raw_frames(self):
+        """
+        Returns the frames sent through os.write() so far.
+        """
+        if self.is_open:
+            self._drain()
+        return [
+            self._raw[i : i + PACKET_SIZE]
+            for i in range(0, len(self._raw) - PACKET_SIZE + 1, PACKET_SIZE)
+        ]
+
+    def frames(self):
+        """
+        Returns every frame sent so far: those from write() in order, then those from os.write().
+        """
+        return self.writes + self.raw_frames()
+
+
+class ControllerTestCase(unittest.TestCase):
+    """
+    Patches serial.Serial with FakeSerial and skips the adapter latency tweak.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(serial, "Serial", FakeSerial)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        latency = mock.patch.object(DmxController, "_set_low_latency")
+        latency.start()
+        self.addCleanup(latency.stop)
+
+    def connect(self, **kwargs):
+        dmx = DmxController(port=PORT, **kwargs)
+        self.addCleanup(dmx.disconnect)
+        return dmx
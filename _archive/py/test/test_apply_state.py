@@ -0,0 +1,22 @@
+"""
+apply_state() replaces every channel at once.
+"""
+
+import unittest
+
+from py import controller
+from py.test.fakes import ControllerTestCase
+
+
+class ApplyStateTest(ControllerTestCase):
+    def test_apply_state_rejects_an_integer(self):
+        dmx = self.connect()
+        dmx.set_channel(1, 9)
+
+        with self.assertLogs(controller._log, "WARNING"):
+            dmx.apply_state(32)
+        self.assertEqual(dmx.get_channel_value(1), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+batch() coalesces every channel change made inside it into a single frame.
+"""
+
+import threading
+import unittest
+
+from py import controller
+from py.test.fakes import ControllerTestCase, wait_until
+
+
+class CountingEvent(threading.Event):
+    """
+    Counts wait() calls, so a test can tell when the writer thread is idle again.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.waits = 0
+
+    def wait(self, timeout=None):
+        self.waits += 1
+        return super().wait(timeout)
+
+
+def count_writer_waits(dmx):
+    """
+    Swaps in a CountingEvent for the writer thread's wake-up event and returns it.
+    """
+    old, dmx._tx_event = dmx._tx_event, CountingEvent()
+    old.set()  # Wake the writer so it goes back to sleep on the new event
+    assert wait_until(lambda: dmx._tx_event.waits)
+    return dmx._tx_event
+
+
+class BatchTest(ControllerTestCase):
+    def test_batch_sends_one_frame(self):
+        dmx = self.connect()
+        ser = dmx.serial_port
+        sent = len(ser.writes)
+
+        with dmx.batch():
+            dmx.set_channel(1, 10)
+            dmx.set_lamp_mode("manual")
+            dmx.apply_state(bytes([7]) * 32)
+            dmx.set_channel(2, 20)
+            self.assertEqual(len(ser.writes), sent)
+
+        self.assertEqual(len(ser.writes), sent + 1)
+        self.assertEqual(ser.writes[-1][:4], bytes([0, 7, 20, 7]))
+
+    def test_only_the_outermost_batch_sends(self):
+        dmx = self.connect()
+        ser = dmx.serial_port
+        sent = len(ser.writes)
+
+        with dmx.batch():
+            with dmx.batch():
+                dmx.set_channel(1, 10)
+            self.assertEqual(len(ser.writes), sent)
+        self.assertEqual(len(ser.writes), sent + 1)
+
+    def test_unchanged_batch_sends_nothing(self):
+        dmx = self.connect()
+        ser = dmx.serial_port
+        sent = len(ser.writes)
+
+        with dmx.batch():
+            pass
+        self.assertEqual(len(ser.writes), sent)
+
+    def test_send_and_reset_are_deferred_inside_a_batch(self):
+        dmx = self.connect()
+        ser = dmx.serial_port
+        dmx.set_channel(5, 50)
+        sent = len(ser.writes)
+
+        with dmx.batch():
+            dmx.set_channel(1, 10)
+            dmx.reset_all_channels()
+            dmx.send_dmx_packet({3: 30}, force=True)
+            dmx.set_channel(2, 20)
+            self.assertEqual(len(ser.writes), sent)
+
+        self.assertEqual(len(ser.writes), sent + 1)
+        self.assertEqual(ser.writes[-1][:6], bytes([0, 0, 20, 30, 0, 0]))
+
+    def test_unmatched_end_batch_warns(self):
+        dmx = self.connect()
+
+        with self.assertLogs(controller._log, "WARNING"):
+            dmx.end_batch()
+        self.assertEqual(dmx._batch_depth, 0)
+
+
+class ThreadedBatchTest(ControllerTestCase):
+    def test_burst_collapses_into_one_write(self):
+        dmx = self.connect(threaded=True)
+        ser = dmx.serial_port
+        event = count_writer_waits(dmx)
+        entered = threading.Event()
+        release = threading.Event()
+        write = ser.write
+
+        def slow_write(data):
+            entered.set()
+            release.wait()
+            return write(data)
+
+        ser.write = slow_write
+        sent = len(ser.writes)
+        dmx.set_channel(1, 1)
+        self.assertTrue(entered.wait(2))
+        waits = event.waits
+        for value in (2, 3, 4):
+            dmx.set_channel(1, value)
+        release.set()
+
+        # Idle again after the first write and one write for the whole burst
+        self.assertTrue(wait_until(lambda: event.waits >= waits + 2))
+        self.assertEqual([f[1] for f in ser.writes[sent:]], [1, 4])
+
+    def test_pending_send_waits_for_the_batch(self):
+        dmx = self.connect(threaded=True)
+        ser = dmx.serial_port
+        event = count_writer_waits(dmx)
+
+        with dmx.batch():
+            dmx.set_channel(2, 20)
+            # A send requested before the batch and still pending
+            waits = event.waits
+            event.set()
+            self.assertTrue(wait_until(lambda: event.waits > waits))
+            dmx.set_channel(3, 30)
+
+        self.assertTrue(wait_until(lambda: ser.writes[-1][:4] == bytes([0, 0, 20, 30])))
+        self.assertNotIn(bytes([0, 0, 20, 0]), [f[:4] for f in ser.writes])
+
+
+if __name__ == "__main__":
+    unittest.main()
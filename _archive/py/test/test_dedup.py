@@ -0,0 +1,54 @@
+"""
+Unchanged frames are not written again unless forced.
+"""
+
+import unittest
+
+from py import controller
+from py.test.fakes import ControllerTestCase
+
+
+class DedupTest(ControllerTestCase):
+    def test_unchanged_frame_is_skipped(self):
+        dmx = self.connect()
+        ser = dmx.serial_port
+        dmx.set_channel(1, 10)
+        sent = len(ser.writes)
+
+        dmx.set_channel(1, 10)
+        dmx.send_dmx_packet()
+        dmx.send_dmx_packet({1: 10})
+        dmx.apply_state(bytes(dmx.current_state))
+        self.assertEqual(len(ser.writes), sent)
+
+    def test_force_resends_an_unchanged_frame(self):
+        dmx = self.connect()
+        ser = dmx.serial_port
+        dmx.set_channel(1, 10)
+        sent = len(ser.writes)
+
+        dmx.send_dmx_packet(force=True)
+        self.assertEqual(len(ser.writes), sent + 1)
+        self.assertEqual(ser.writes[-1], ser.writes[-2])
+
+    def test_failed_write_is_not_skipped_next_time(self):
+        dmx = self.connect()
+        ser = dmx.serial_port
+        write = ser.write
+
+        def failing_write(data):
+            raise OSError("device unplugged")
+
+        ser.write = failing_write
+        with self.assertLogs(controller._log, "ERROR"):
+            dmx.set_channel(1, 10)
+        ser.write = write
+        sent = len(ser.writes)
+
+        dmx.send_dmx_packet()
+        self.assertEqual(len(ser.writes), sent + 1)
+        self.assertEqual(ser.writes[-1][1], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+Once a frame is on the wire, set_channel patches one byte of the packet and resends it.
+"""
+
+import unittest
+
+from py.test.fakes import ControllerTestCase
+
+
+class SingleByteUpdateTest(ControllerTestCase):
+    def test_patch_keeps_the_other_channels(self):
+        dmx = self.connect()
+        ser = dmx.serial_port
+        dmx.apply_state(bytes(range(32)))
+
+        dmx.set_channel(5, 200)
+        self.assertEqual(ser.writes[-1], bytes([0]) + bytes(dmx.current_state))
+        self.assertEqual(ser.writes[-1][5], 200)
+        self.assertEqual(ser.writes[-1][6], 5)
+
+    def test_patch_with_the_same_value_sends_nothing(self):
+        dmx = self.connect()
+        ser = dmx.serial_port
+        dmx.set_channel(5, 200)
+        sent = len(ser.writes)
+
+        dmx.set_channel(5, 200)
+        self.assertEqual(len(ser.writes), sent)
+
+    def test_unsynced_packet_is_rebuilt_from_state(self):
+        dmx = self.connect()
+        ser = dmx.serial_port
+        dmx._synced = False
+        dmx.current_state[0] = 7  # Changed without sending
+
+        dmx.set_channel(2, 20)
+        self.assertEqual(ser.writes[-1][1:3], bytes([7, 20]))
+
+
+if __name__ == "__main__":
+    unittest.main()
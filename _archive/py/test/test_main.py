@@ -0,0 +1,27 @@
+"""
+The demo resolves its schedule to frames before the timed loop.
+"""
+
+import unittest
+
+from py.controller import DmxController
+from py.main import SCHEDULE, _precompute_frames
+
+
+class PrecomputeFramesTest(unittest.TestCase):
+    def test_frames_are_built_without_sending(self):
+        live = DmxController(offline=True)
+        live.set_channel(32, 99)
+
+        with self.assertNoLogs(level="ERROR"):
+            frames = _precompute_frames(live, SCHEDULE)
+
+        self.assertEqual(len(frames), len(SCHEDULE))
+        self.assertEqual(frames[0][0], 100)  # Lamp mode: dynamic sound
+        self.assertEqual(frames[-1][31], 99)  # Starts from the live state
+        self.assertEqual(frames[-1][7], 192)  # Vertical movement: move up
+        self.assertEqual(bytes(live.current_state), bytes(31) + bytes([99]))
+
+
+if __name__ == "__main__":
+    unittest.main()
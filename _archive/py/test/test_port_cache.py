@@ -0,0 +1,122 @@
+"""
+Port auto-detection matches adapters by USB VID:PID and caches the result.
+"""
+
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import serial
+
+from py import controller
+from py.controller import DmxController
+from py.test.fakes import ControllerTestCase
+
+
+def usb_port(device, vid=None, pid=None, description="n/a"):
+    return SimpleNamespace(
+        device=device, vid=vid, pid=pid, serial_number="A1", description=description
+    )
+
+
+class PortCacheTest(ControllerTestCase):
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_path = os.path.join(tmp.name, "dmx_port.json")
+        # Detected devices must exist on disk for the cache to be trusted
+        self.device = os.path.join(tmp.name, "ttyUSB0")
+        open(self.device, "w").close()
+        by_id = os.path.join(tmp.name, "by-id")
+        os.mkdir(by_id)
+        self.alias = os.path.join(by_id, "usb-FTDI_FT232R_USB_UART_A1-if00-port0")
+        os.symlink(self.device, self.alias)
+        for name, value in (
+            ("_PORT_CACHE_PATH", self.cache_path),
+            ("_SERIAL_BY_ID_DIR", by_id),
+        ):
+            patcher = mock.patch.object(controller, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(controller.sys, "platform", "linux")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def comports(self, ports):
+        patcher = mock.patch.object(
+            serial.tools.list_ports, "comports", return_value=ports
+        )
+        mocked = patcher.start()
+        self.addCleanup(patcher.stop)
+        return mocked
+
+    def detect(self):
+        dmx = DmxController()
+        self.addCleanup(dmx.disconnect)
+        return dmx
+
+    def test_known_adapter_wins_over_description(self):
+        self.comports(
+            [
+                usb_port("/dev/ttyOTHER", description="USB Serial Device"),
+                usb_port(self.device, vid=0x0403, pid=0x6001),
+            ]
+        )
+
+        self.assertEqual(self.detect().port, self.device)
+
+    def test_detected_adapter_is_cached_by_its_stable_path(self):
+        comports = self.comports([usb_port(self.device, vid=0x0403, pid=0x6001)])
+        self.detect().disconnect()
+        comports.return_value = []
+
+        self.assertEqual(self.detect().port, self.alias)
+        comports.assert_called_once()
+
+    def test_adapter_without_stable_path_is_not_cached(self):
+        os.remove(self.alias)
+        self.comports([usb_port(self.device, vid=0x0403, pid=0x6001)])
+
+        self.detect().disconnect()
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_adapter_that_fails_to_open_is_not_cached(self):
+        self.comports([usb_port(self.device, vid=0x0403, pid=0x6001)])
+
+        with mock.patch.object(
+            serial, "Serial", side_effect=serial.SerialException("busy")
+        ):
+            with self.assertLogs(controller._log, "ERROR"):
+                dmx = self.detect()
+        self.assertIsNone(dmx.serial_port)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_cache_is_cleared_when_the_port_fails_to_open(self):
+        self.comports([usb_port(self.device, vid=0x0403, pid=0x6001)])
+        self.detect().disconnect()
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        with mock.patch.object(
+            serial, "Serial", side_effect=serial.SerialException("busy")
+        ):
+            with self.assertLogs(controller._log, "ERROR"):
+                dmx = self.detect()
+        self.assertIsNone(dmx.serial_port)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_cache_survives_a_num_channels_mismatch(self):
+        self.comports([usb_port(self.device, vid=0x0403, pid=0x6001)])
+        self.detect().disconnect()
+        self.detect()
+
+        with self.assertLogs(controller._log, "ERROR"):
+            dmx = DmxController(num_channels=16)
+        self.assertIsNone(dmx.serial_port)
+        self.assertTrue(os.path.exists(self.cache_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
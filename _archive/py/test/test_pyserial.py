@@ -1,13 +1,14 @@
 import serial
+import sys
 
 print("Inspecting the 'serial' module...")
 
 # Get a list of all attributes (fields, methods, classes) in the 'serial' module
 attributes = dir(serial)
 
-# Print each attribute
-for attr_name in attributes:
-    print(attr_name)
+# Print each attribute, as a single write rather than one per line
+sys.stdout.write("\n".join(attributes) + "\n")
+sys.stdout.flush()
 
 print(
     "\n'serial' module attributes listed. "
@@ -15,8 +16,8 @@ print(
 )
 
 # You can optionally check for specific attributes you expect to be present:
-if "Serial" in attributes:
+if hasattr(serial, "Serial"):
     print("\n'Serial' class found, indicating a successful pyserial import.")
-if "VERSION" in attributes:
-    version_tuple = getattr(serial, "VERSION")
+version_tuple = getattr(serial, "VERSION", None)
+if version_tuple is not None:
     print(f"pyserial version detected: {'.'.join(map(str, version_tuple))}")
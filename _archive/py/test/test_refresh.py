@@ -0,0 +1,40 @@
+"""
+refresh_rate keeps re-sending the last committed frame from a background thread.
+"""
+
+import unittest
+
+from py.test.fakes import ControllerTestCase, wait_until
+
+
+class RefreshTest(ControllerTestCase):
+    def test_refresh_never_sends_a_partial_batch(self):
+        dmx = self.connect(refresh_rate=200)
+        ser = dmx.serial_port
+        self.assertTrue(wait_until(lambda: ser.raw_frames()))
+
+        with dmx.batch():
+            dmx.set_channel(1, 10)
+            refreshed = len(ser.raw_frames())
+            # Let a few refreshes go out while the batch is half applied
+            self.assertTrue(wait_until(lambda: len(ser.raw_frames()) >= refreshed + 3))
+            dmx.set_channel(2, 20)
+
+        self.assertTrue(
+            wait_until(lambda: any(f[:3] == bytes([0, 10, 20]) for f in ser.frames()))
+        )
+        self.assertNotIn(bytes([0, 10, 0]), [f[:3] for f in ser.frames()])
+
+    def test_refresh_resends_last_frame(self):
+        dmx = self.connect(refresh_rate=200)
+        ser = dmx.serial_port
+        dmx.set_channel(3, 30)
+
+        self.assertTrue(wait_until(lambda: any(f[3] == 30 for f in ser.writes)))
+        resent = len(ser.raw_frames())
+        self.assertTrue(wait_until(lambda: len(ser.raw_frames()) >= resent + 5))
+        self.assertEqual(ser.raw_frames()[-1][3], 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
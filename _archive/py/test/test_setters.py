@@ -0,0 +1,51 @@
+"""
+The laser setters address fixed channels, some of which lie beyond a short universe.
+"""
+
+import unittest
+
+from py import controller
+from py.test.fakes import ControllerTestCase
+
+
+class ShortUniverseTest(ControllerTestCase):
+    def test_setters_skip_channels_beyond_num_channels(self):
+        dmx = self.connect(num_channels=16)
+
+        with self.assertLogs(controller._log, "WARNING"):
+            dmx.set_color_change("red")
+        self.assertEqual(bytes(dmx.current_state), bytes(16))
+
+    def test_dependent_setters_skip_channels_beyond_num_channels(self):
+        dmx = self.connect(num_channels=16)
+
+        with self.assertLogs(controller._log, "WARNING"):
+            dmx.set_gradual_drawing(2, "forward_manual", 5)
+        with self.assertLogs(controller._log, "WARNING"):
+            dmx.set_node_expansion(2, 10)
+        self.assertEqual(bytes(dmx.current_state), bytes(16))
+
+    def test_node_expansion_without_gradual_drawing_channel(self):
+        dmx = self.connect(num_channels=14)
+
+        dmx.set_node_expansion(1, 10)
+        self.assertEqual(dmx.get_channel_value(14), 10)
+
+
+class DisconnectedTest(ControllerTestCase):
+    def test_nothing_is_stored_after_disconnect(self):
+        dmx = self.connect()
+        dmx.set_channel(1, 5)
+        dmx.disconnect()
+
+        with self.assertLogs(controller._log, "ERROR"):
+            dmx.set_channel(1, 99)
+        with self.assertLogs(controller._log, "ERROR"):
+            dmx.set_lamp_mode("manual")
+        with self.assertLogs(controller._log, "ERROR"):
+            dmx.apply_state(bytes([7]) * 32)
+        self.assertEqual(dmx.get_channel_value(1), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
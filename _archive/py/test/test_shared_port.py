@@ -0,0 +1,92 @@
+"""
+Controllers opened on the same port share one serial.Serial and one universe.
+"""
+
+import unittest
+
+from py import controller
+from py.controller import DmxController
+from py.test.fakes import PORT, ControllerTestCase, wait_until
+
+
+class SharedPortTest(ControllerTestCase):
+    def test_last_release_closes_port(self):
+        a = self.connect()
+        b = self.connect()
+        self.assertIs(a.serial_port, b.serial_port)
+        ser = a.serial_port
+
+        a.disconnect()
+        self.assertTrue(ser.is_open)
+        b.disconnect()
+        self.assertFalse(ser.is_open)
+        self.assertNotIn(PORT, controller._shared_ports)
+
+    def test_stale_handle_does_not_release_reopened_port(self):
+        a = self.connect()
+        a.serial_port.close()
+        b = self.connect()
+
+        a.disconnect()
+        self.assertTrue(b.serial_port.is_open)
+
+    def test_controllers_share_channel_state(self):
+        a = self.connect()
+        b = self.connect()
+
+        a.set_channel(1, 10)
+        b.set_channel(2, 20)
+        self.assertEqual(b.serial_port.writes[-1][1:3], bytes([10, 20]))
+
+    def test_batch_is_hidden_from_other_controllers(self):
+        a = self.connect()
+        b = self.connect()
+        ser = a.serial_port
+        a.set_channel(1, 1)
+        a.set_channel(2, 2)
+        sent = len(ser.writes)
+
+        with b.batch():
+            b.set_channel(1, 10)
+            b.set_channel(3, 30)
+            a.send_dmx_packet({5: 50})
+            a.send_dmx_packet(force=True)
+            a.set_channel(2, 20)
+            self.assertEqual(a.get_channel_value(1), 1)
+            self.assertEqual(b.get_channel_value(1), 10)
+            self.assertTrue(all(f[1] == 1 and f[3] == 0 for f in ser.writes[sent:]))
+
+        # b's changes land on top of a's, which survive where b changed nothing
+        self.assertEqual(ser.writes[-1][:6], bytes([0, 10, 20, 30, 0, 50]))
+        self.assertEqual(a.get_channel_value(3), 30)
+
+    def test_writes_hold_the_shared_lock(self):
+        refreshing = self.connect(refresh_rate=200)
+        direct = self.connect()
+        ser = direct.serial_port
+        self.assertIs(refreshing._tx_lock, direct._tx_lock)
+        lock = direct._tx_lock
+        held = []
+        write = ser.write
+
+        def checked_write(data):
+            held.append(lock.locked())
+            return write(data)
+
+        ser.write = checked_write
+        direct.set_channel(1, 10)  # Full frame
+        direct.set_channel(2, 20)  # Single-byte patch of the synced packet
+        direct.apply_state(bytes([5]) * 32)
+        refreshing.set_channel(3, 30)
+        self.assertTrue(wait_until(lambda: len(held) >= 4))
+        self.assertTrue(all(held))
+
+    def test_mismatched_num_channels_is_refused(self):
+        self.connect()
+        with self.assertLogs(controller._log, "ERROR"):
+            c = DmxController(port=PORT, num_channels=16)
+        self.assertIsNone(c.serial_port)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+SerialProcess hands frames to a worker process that owns the port.
+
+The fake port only reaches the worker when it is forked, so these tests are
+skipped under other start methods.
+"""
+
+import multiprocessing
+import threading
+import unittest
+from unittest import mock
+
+import serial
+
+from py.controller_worker import SerialProcess
+from py.test.fakes import PORT, FakeSerial, wait_until
+
+
+class FailingSerial(FakeSerial):
+    def write(self, data):
+        raise serial.SerialException("device unplugged")
+
+
+class StuckSerial(FakeSerial):
+    def write(self, data):
+        threading.Event().wait()
+
+
+@unittest.skipUnless(
+    multiprocessing.get_start_method() == "fork", "needs the fork start method"
+)
+class SerialProcessTest(unittest.TestCase):
+    def open(self, serial_class):
+        with mock.patch.object(serial, "Serial", serial_class):
+            proc = SerialProcess(PORT)
+        self.addCleanup(proc.close)
+        return proc
+
+    def test_failed_write_is_raised_by_the_next_write(self):
+        proc = self.open(FailingSerial)
+        proc.write(bytes(33))
+
+        def write_fails():
+            try:
+                proc.write(bytes(33))
+            except serial.SerialException:
+                return True
+            return False
+
+        self.assertTrue(wait_until(write_fails))
+
+    def test_close_terminates_a_stuck_worker(self):
+        proc = self.open(StuckSerial)
+        proc.write(bytes(33))
+
+        proc.close()
+        self.assertFalse(proc._process.is_alive())
+        with self.assertRaises(serial.SerialException):
+            proc.write(bytes(33))
+
+
+if __name__ == "__main__":
+    unittest.main()